@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Ahead-of-time compile the numeric kernels used by generate_dashboard_assets.py.
+
+Run once after installing numba:
+
+    python3 python/_dashboard_kernels_build.py
+
+This writes a `_dashboard_kernels` extension module next to this file. When it is
+present, generate_dashboard_assets.py imports it instead of JIT-compiling on every run.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from generate_dashboard_assets import _high_risk_loop
+
+cc = CC("_dashboard_kernels")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Export the script's own loop so the AOT, JIT and numpy paths share one definition.
+cc.export("high_risk", "int8[:](float64[:], float64[:])")(_high_risk_loop)
+
+
+if __name__ == "__main__":
+    cc.compile()
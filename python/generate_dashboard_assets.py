@@ -1,25 +1,54 @@
 #!/usr/bin/env python3
 
 import argparse
+import csv
+import glob
+import hashlib
 import json
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 
-# Matplotlib backend for headless environments
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
 
-from sklearn.compose import ColumnTransformer
-from sklearn.impute import SimpleImputer
-from sklearn.linear_model import LogisticRegression
-from sklearn.model_selection import train_test_split
-from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder
+    # Multithreaded CSV parsing with Arrow-backed columns (no per-cell Python objects).
+    READ_CSV_KWARGS: Dict[str, Any] = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    READ_CSV_KWARGS = {}
+
+# matplotlib, sklearn, scipy and numba are imported where they are used, so runs that skip
+# charts or model training never pay their import cost.
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# Fast zlib level for PNG output and no "Software" text chunk.
+PNG_SAVE_KWARGS: Dict[str, Any] = {"dpi": 160, "pil_kwargs": {"compress_level": 1}, "metadata": {"Software": None}}
+
+# Column names the script knows how to use; anything else in the CSVs is never parsed.
+ACTION_COLS = ["Action Taken", "Action taken"]
+INCIDENT_DATE_COLS = ["Incident Date", "Date", "incidentDate", "incident_date"]
+SEVERITY_COLS = ["Severity", "severityScore", "Severity Score"]
+LIKELIHOOD_COLS = ["Likelihood", "likelihoodScore", "Likelihood Score"]
+CATEGORICAL_FEATURE_COLS = ["Category", "Department", "Site / Project", "Location"]
+
+OBS_COLS = frozenset(["Observation Type", "Site / Location", *ACTION_COLS])
+INC_COLS = frozenset([*INCIDENT_DATE_COLS, *SEVERITY_COLS, *LIKELIHOOD_COLS, *CATEGORICAL_FEATURE_COLS])
+
+# Summary sections (and the assets they own) that depend on each source CSV.
+SOURCE_SECTIONS = {
+    "observations": (("observations",), ("observationsByType", "observationsBySite")),
+    "incidents": (("incidents", "model"), ("incidentsOverTime",)),
+}
 
 
 @dataclass
@@ -36,83 +65,257 @@ def _safe_mkdir(path: str) -> None:
 
 
 def _write_json(path: str, data: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-
-def _plot_bar(series: pd.Series, title: str, out_path: str, top_n: int = 10) -> None:
-    s = series.dropna()
-    s = s.astype(str)
-    counts = s.value_counts().head(top_n)
-
-    plt.figure(figsize=(10, 5))
-    counts.sort_values().plot(kind="barh")
-    plt.title(title)
-    plt.xlabel("Count")
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=160)
-    plt.close()
-
-
-def _plot_incidents_over_time(df: pd.DataFrame, date_col: str, out_path: str) -> None:
-    if date_col not in df.columns:
+    try:
+        import orjson
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
         return
 
-    dates = pd.to_datetime(df[date_col], errors="coerce")
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with open(path, "wb") as f:
+        f.write(payload)
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _fingerprint(path: str) -> Optional[str]:
+    if not os.path.exists(path):
+        return None
+    # Nanosecond mtime: a same-size rewrite within the same second must still count as a change.
+    st = os.stat(path)
+    return f"{st.st_size}-{st.st_mtime_ns}"
+
+
+def _is_source_fresh(previous: Optional[Dict[str, Any]], source: str, path: str, outdir: str) -> bool:
+    if previous is None:
+        return False
+    if previous.get("sources", {}).get(source) != path:
+        return False
+    if previous.get("fingerprints", {}).get(source, "") != _fingerprint(path):
+        return False
+
+    _, asset_keys = SOURCE_SECTIONS[source]
+    assets = previous.get("assets", {})
+    return all(os.path.exists(os.path.join(outdir, os.path.basename(assets[k]))) for k in asset_keys if k in assets)
+
+
+def _reuse_source(summary: Dict[str, Any], previous: Dict[str, Any], source: str) -> None:
+    section_keys, asset_keys = SOURCE_SECTIONS[source]
+    for key in section_keys:
+        summary[key] = previous.get(key, {})
+    for key in asset_keys:
+        if key in previous.get("assets", {}):
+            summary["assets"][key] = previous["assets"][key]
+
+
+def _needed_columns(path: str, candidates: Iterable[str]) -> List[str]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        header = next(csv.reader(f), [])
+
+    wanted = set(candidates)
+    needed = [c for c in header if c in wanted]
+    # Keep at least one column so the row count is still correct when nothing matches.
+    return needed or header[:1]
+
+
+def _load_table(path: str, usecols: List[str], parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
+    if not READ_CSV_KWARGS:
+        return pd.read_csv(path, usecols=usecols, parse_dates=parse_dates)
+
+    # Parquet cache next to the CSV, keyed on size + mtime and the projected columns.
+    cols_key = hashlib.sha1("\0".join(usecols).encode("utf-8")).hexdigest()[:8]
+    cache = f"{path}.{_fingerprint(path)}-{cols_key}.parquet"
+    if os.path.exists(cache):
+        try:
+            return pd.read_parquet(cache, engine="pyarrow", memory_map=True, dtype_backend="pyarrow")
+        except (OSError, pa.ArrowException):
+            # Damaged cache (e.g. an interrupted write): drop it and re-parse the CSV below.
+            try:
+                os.remove(cache)
+            except OSError:
+                pass
+
+    df = pd.read_csv(path, usecols=usecols, parse_dates=parse_dates, **READ_CSV_KWARGS)
+    tmp_path = None
+    try:
+        prefix = glob.escape(path)
+        for stale in glob.glob(f"{prefix}.*.parquet") + glob.glob(f"{prefix}.*.tmp"):
+            os.remove(stale)
+        # Write to a temp file and rename so readers never see a partially written cache.
+        tmp_path = f"{cache}.{os.getpid()}-{threading.get_ident()}.tmp"
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, cache)
+        tmp_path = None
+    except (OSError, pa.ArrowException):
+        # Caching is best-effort (e.g. read-only data directory).
+        pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return df
+
+
+@lru_cache(maxsize=None)
+def _figure_class() -> type:
+    import matplotlib
+
+    # Matplotlib backend for headless environments
+    matplotlib.use("Agg")
+    matplotlib.rcParams.update({"path.simplify_threshold": 1.0, "agg.path.chunksize": 10000})
+    from matplotlib.figure import Figure
+
+    return Figure
+
+
+def _new_axes(figsize: Tuple[float, float]) -> "Axes":
+    # A standalone Figure skips pyplot's global registry, so charts can render on worker threads.
+    fig = _figure_class()(figsize=figsize, layout="constrained")
+    return fig.subplots()
+
+
+def _plot_bar(series: pd.Series, title: str, out_path: str, top_n: int = 10) -> bool:
+    counts = series.dropna().value_counts(sort=True).head(top_n).sort_values()
+    # A single bar (or none) says nothing; skip the chart entirely.
+    if len(counts) < 2:
+        return False
+
+    positions = np.arange(len(counts))
+    ax = _new_axes((10, 5))
+    ax.barh(positions, counts.to_numpy())
+    ax.set_yticks(positions)
+    ax.set_yticklabels(counts.index.astype(str))
+    ax.set_title(title)
+    ax.set_xlabel("Count")
+    ax.figure.savefig(out_path, **PNG_SAVE_KWARGS)
+    return True
+
+
+def _plot_incidents_over_time(df: pd.DataFrame, date_col: str, out_path: str) -> bool:
+    if date_col not in df.columns:
+        return False
+
+    dates = df[date_col]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Infer the format once from a sample so pandas uses its fast strptime path instead of dateutil.
+        sample = dates.dropna()
+        fmt = guess_datetime_format(str(sample.iloc[0])) if len(sample) else None
+        dates = pd.to_datetime(dates, errors="coerce", format=fmt, cache=True)
     dates = dates.dropna().dt.date
     if dates.empty:
-        return
+        return False
+
+    # groupby sorts its keys, so the counts come out in date order.
+    counts = dates.groupby(dates).size()
 
-    counts = dates.value_counts().sort_index()
+    ax = _new_axes((10, 4))
+    ax.plot(list(counts.index), counts.to_numpy())
+    ax.set_title("Incidents over time")
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Count")
+    ax.figure.savefig(out_path, **PNG_SAVE_KWARGS)
+    return True
 
-    plt.figure(figsize=(10, 4))
-    plt.plot(list(counts.index), list(counts.values))
-    plt.title("Incidents over time")
-    plt.xlabel("Date")
-    plt.ylabel("Count")
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=160)
-    plt.close()
+
+def _has_text(value: Any) -> bool:
+    text = value if isinstance(value, str) else str(value)
+    return bool(text) and not text.isspace()
 
 
 def _compute_open_closed_observations(observations: pd.DataFrame) -> Tuple[int, int, int]:
     total = int(len(observations))
-    action_col = next((col for col in ["Action Taken", "Action taken"] if col in observations.columns), None)
+    action_col = next((col for col in ACTION_COLS if col in observations.columns), None)
     if not action_col:
         return total, 0, total
 
-    action = observations[action_col].fillna("").astype(str)
-    closed = int((action.str.strip().str.len() > 0).sum())
+    # An observation is closed when "Action Taken" has any non-whitespace text; missing values stay open.
+    action = observations[action_col]
+    if isinstance(action.dtype, pd.ArrowDtype):
+        arr = pa.array(action.array)
+        if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+            arr = arr.cast(pa.large_string())
+        filled = pc.greater(pc.utf8_length(pc.utf8_trim_whitespace(arr)), 0)
+        closed = int(pc.sum(filled).as_py() or 0)
+    else:
+        closed = sum(map(_has_text, action.dropna().to_numpy(dtype=object)))
     open_ = total - closed
     return total, open_, closed
 
 
+def _high_risk_numpy(sev: np.ndarray, like: np.ndarray) -> np.ndarray:
+    # NaN compares False, so missing scores never count as high risk.
+    return ((sev >= 7) | (like >= 7)).astype(np.int8)
+
+
+def _high_risk_loop(sev: np.ndarray, like: np.ndarray) -> np.ndarray:
+    n = sev.shape[0]
+    out = np.empty(n, np.int8)
+    for i in range(n):
+        s = sev[i]
+        lk = like[i]
+        out[i] = 1 if (s == s and s >= 7) or (lk == lk and lk >= 7) else 0
+    return out
+
+
+@lru_cache(maxsize=None)
+def _high_risk_kernel() -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    # Prefer the AOT build from python/_dashboard_kernels_build.py (no JIT warmup),
+    # then a cached numba JIT, then plain numpy.
+    try:
+        from _dashboard_kernels import high_risk
+
+        return high_risk
+    except ImportError:
+        pass
+
+    try:
+        from numba import njit
+    except ImportError:
+        return _high_risk_numpy
+
+    return njit(cache=True)(_high_risk_loop)
+
+
+def _fill_median(values: np.ndarray) -> np.ndarray:
+    missing = np.isnan(values)
+    present = values[~missing]
+    values[missing] = np.median(present) if present.size else 0
+    return values
+
+
 def _train_simple_incident_model(incidents: pd.DataFrame) -> ModelMetrics:
     # Goal: demonstrate sklearn usage without assuming a rigid schema.
     # We try to predict a binary "high risk" flag from whatever columns exist.
-    possible_sev_cols = ["Severity", "severityScore", "Severity Score"]
-    possible_like_cols = ["Likelihood", "likelihoodScore", "Likelihood Score"]
-
-    sev_col = next((c for c in possible_sev_cols if c in incidents.columns), None)
-    like_col = next((c for c in possible_like_cols if c in incidents.columns), None)
+    cols = frozenset(incidents.columns)
+    sev_col = next((c for c in SEVERITY_COLS if c in cols), None)
+    like_col = next((c for c in LIKELIHOOD_COLS if c in cols), None)
 
     if sev_col is None and like_col is None:
         return ModelMetrics(enabled=False, model="LogisticRegression", target="high_risk", rows=int(len(incidents)))
 
-    df = incidents.copy()
+    def to_num(col: Optional[str]) -> np.ndarray:
+        if col is None:
+            return np.full(len(incidents), np.nan)
+        return pd.to_numeric(incidents[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
 
-    def to_num(col: str) -> pd.Series:
-        return pd.to_numeric(df[col], errors="coerce")
-
-    sev = to_num(sev_col) if sev_col else pd.Series([None] * len(df))
-    like = to_num(like_col) if like_col else pd.Series([None] * len(df))
+    sev = to_num(sev_col)
+    like = to_num(like_col)
 
     # Define target: high risk if either score is high.
-    y = ((sev.fillna(0) >= 7) | (like.fillna(0) >= 7)).astype(int)
+    y = _high_risk_kernel()(sev, like)
 
     # If target is constant, skip.
-    if y.nunique() < 2:
-        return ModelMetrics(enabled=False, model="LogisticRegression", target="high_risk", rows=int(len(df)))
+    if np.unique(y).size < 2:
+        return ModelMetrics(enabled=False, model="LogisticRegression", target="high_risk", rows=int(len(incidents)))
 
     feature_cols = []
     if sev_col:
@@ -121,44 +324,48 @@ def _train_simple_incident_model(incidents: pd.DataFrame) -> ModelMetrics:
         feature_cols.append(like_col)
 
     # Add a few common categorical columns if present.
-    for c in ["Category", "Department", "Site / Project", "Location"]:
-        if c in df.columns and c not in feature_cols:
+    for c in CATEGORICAL_FEATURE_COLS:
+        if c in cols and c not in feature_cols:
             feature_cols.append(c)
 
-    X = df[feature_cols]
-
     numeric_features = [c for c in feature_cols if c in {sev_col, like_col}]
     categorical_features = [c for c in feature_cols if c not in numeric_features]
 
-    preprocessor = ColumnTransformer(
-        transformers=[
-            (
-                "num",
-                Pipeline(steps=[("imputer", SimpleImputer(strategy="median"))]),
-                numeric_features,
-            ),
-            (
-                "cat",
-                Pipeline(steps=[("imputer", SimpleImputer(strategy="most_frequent")), ("onehot", OneHotEncoder(handle_unknown="ignore"))]),
-                categorical_features,
-            ),
-        ],
-        remainder="drop",
-    )
-
-    clf = Pipeline(
-        steps=[
-            ("preprocess", preprocessor),
-            ("model", LogisticRegression(max_iter=1000)),
-        ]
-    )
+    import scipy.sparse as sp
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.model_selection import StratifiedShuffleSplit
+
+    # Scores are small integers, so float32 halves the numeric block at no cost in accuracy.
+    numeric_values = {sev_col: sev.astype(np.float32), like_col: like.astype(np.float32)}
+    X_num = np.column_stack([_fill_median(numeric_values[c]) for c in numeric_features])
+    blocks = [sp.csr_matrix(X_num)]
+
+    # One-hot encode the categoricals straight into a sparse block; missing values get their own column.
+    if categorical_features:
+        # Convert to object before filling: Arrow-typed columns (e.g. int64 codes) reject a string fill value.
+        cats = pd.DataFrame(
+            {c: incidents[c].astype(object).where(incidents[c].notna(), "__NA__") for c in categorical_features}
+        )
+        blocks.append(pd.get_dummies(cats, sparse=True, dtype=np.float32).sparse.to_coo().tocsr())
+
+    X = sp.hstack(blocks, format="csr")
+
+    # liblinear converges in a few coordinate-descent passes on small problems; lbfgs only pays
+    # off for large, purely numeric inputs.
+    if not categorical_features and X.shape[0] > 50_000:
+        clf = LogisticRegression(max_iter=1000)
+    else:
+        clf = LogisticRegression(solver="liblinear", max_iter=200, tol=1e-3)
 
     # Train/test split (small datasets still ok; we just report a simple accuracy).
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.25, random_state=42, stratify=y)
+    sss = StratifiedShuffleSplit(n_splits=1, test_size=0.25, random_state=42)
+    train_idx, test_idx = next(sss.split(np.zeros(len(y)), y))
+    X_train, X_test = X[train_idx], X[test_idx]
+    y_train, y_test = y[train_idx], y[test_idx]
     clf.fit(X_train, y_train)
     acc = float(clf.score(X_test, y_test))
 
-    return ModelMetrics(enabled=True, model="LogisticRegression", target="high_risk", rows=int(len(df)), accuracy=acc)
+    return ModelMetrics(enabled=True, model="LogisticRegression", target="high_risk", rows=int(len(incidents)), accuracy=acc)
 
 
 def main() -> None:
@@ -166,9 +373,19 @@ def main() -> None:
     parser.add_argument("--observations", default="data/observations.csv", help="Path to observations CSV")
     parser.add_argument("--incidents", default="data/incidents.csv", help="Path to incidents CSV")
     parser.add_argument("--outdir", default="public/dashboard-assets", help="Output directory under the web app")
+    parser.add_argument("--force", action="store_true", help="Regenerate everything even if the CSVs are unchanged")
 
     args = parser.parse_args()
     outdir = args.outdir
+    summary_path = os.path.join(outdir, "summary.json")
+
+    # Skip work for sources whose CSV fingerprint matches the previous run.
+    previous = None if args.force else _read_json(summary_path)
+    obs_fresh = _is_source_fresh(previous, "observations", args.observations, outdir)
+    inc_fresh = _is_source_fresh(previous, "incidents", args.incidents, outdir)
+    if obs_fresh and inc_fresh:
+        return
+
     _safe_mkdir(outdir)
 
     summary: Dict[str, Any] = {
@@ -177,64 +394,90 @@ def main() -> None:
             "observations": args.observations,
             "incidents": args.incidents,
         },
+        "fingerprints": {
+            "observations": _fingerprint(args.observations),
+            "incidents": _fingerprint(args.incidents),
+        },
         "observations": {},
         "incidents": {},
         "model": {},
         "assets": {},
     }
 
-    # Load observations
-    obs_df: Optional[pd.DataFrame] = None
-    if os.path.exists(args.observations):
-        obs_df = pd.read_csv(args.observations)
-        total, open_, closed = _compute_open_closed_observations(obs_df)
-        summary["observations"] = {
-            "rows": int(len(obs_df)),
-            "total": total,
-            "open": open_,
-            "closed": closed,
-        }
-
-        if "Observation Type" in obs_df.columns:
-            out_path = os.path.join(outdir, "observations_by_type.png")
-            _plot_bar(obs_df["Observation Type"], "Observations by type", out_path)
-            summary["assets"]["observationsByType"] = "/dashboard-assets/observations_by_type.png"
-
-        if "Site / Location" in obs_df.columns:
-            out_path = os.path.join(outdir, "observations_by_site.png")
-            _plot_bar(obs_df["Site / Location"], "Observations by site", out_path)
-            summary["assets"]["observationsBySite"] = "/dashboard-assets/observations_by_site.png"
-
-    else:
-        summary["observations"] = {"rows": 0, "note": "Observations CSV not found"}
-
-    # Load incidents
-    inc_df: Optional[pd.DataFrame] = None
-    if os.path.exists(args.incidents):
-        inc_df = pd.read_csv(args.incidents)
-        summary["incidents"] = {"rows": int(len(inc_df))}
+    # CSV parsing and chart rendering spend most of their time in C code that releases the GIL,
+    # so both files load concurrently and charts render while the model trains.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        obs_future: Optional[Future] = None
+        if not obs_fresh and os.path.exists(args.observations):
+            obs_cols = _needed_columns(args.observations, OBS_COLS)
+            obs_future = pool.submit(_load_table, args.observations, obs_cols)
 
-        # Try multiple likely date columns.
+        inc_future: Optional[Future] = None
         date_col = None
-        for c in ["Incident Date", "Date", "incidentDate", "incident_date"]:
-            if c in inc_df.columns:
-                date_col = c
-                break
-
-        if date_col:
-            out_path = os.path.join(outdir, "incidents_over_time.png")
-            _plot_incidents_over_time(inc_df, date_col, out_path)
-            summary["assets"]["incidentsOverTime"] = "/dashboard-assets/incidents_over_time.png"
-
-        # Train a small model if feasible.
-        metrics = _train_simple_incident_model(inc_df)
-        summary["model"] = asdict(metrics)
-
-    else:
-        summary["incidents"] = {"rows": 0, "note": "Incidents CSV not found"}
-        summary["model"] = asdict(ModelMetrics(enabled=False, model="LogisticRegression", target="high_risk", rows=0))
-
-    _write_json(os.path.join(outdir, "summary.json"), summary)
+        if not inc_fresh and os.path.exists(args.incidents):
+            inc_cols = _needed_columns(args.incidents, INC_COLS)
+
+            # Try multiple likely date columns.
+            inc_columns = frozenset(inc_cols)
+            date_col = next((c for c in INCIDENT_DATE_COLS if c in inc_columns), None)
+
+            inc_future = pool.submit(_load_table, args.incidents, inc_cols, [date_col] if date_col else None)
+
+        charts: List[Tuple[str, str, Future]] = []
+
+        # Load observations
+        if obs_fresh:
+            _reuse_source(summary, previous, "observations")
+        elif obs_future is not None:
+            obs_df: pd.DataFrame = obs_future.result()
+            total, open_, closed = _compute_open_closed_observations(obs_df)
+            summary["observations"] = {
+                "rows": int(len(obs_df)),
+                "total": total,
+                "open": open_,
+                "closed": closed,
+            }
+
+            obs_columns = frozenset(obs_df.columns)
+            if "Observation Type" in obs_columns:
+                out_path = os.path.join(outdir, "observations_by_type.png")
+                job = pool.submit(_plot_bar, obs_df["Observation Type"], "Observations by type", out_path)
+                charts.append(("observationsByType", "/dashboard-assets/observations_by_type.png", job))
+
+            if "Site / Location" in obs_columns:
+                out_path = os.path.join(outdir, "observations_by_site.png")
+                job = pool.submit(_plot_bar, obs_df["Site / Location"], "Observations by site", out_path)
+                charts.append(("observationsBySite", "/dashboard-assets/observations_by_site.png", job))
+
+        else:
+            summary["observations"] = {"rows": 0, "note": "Observations CSV not found"}
+
+        # Load incidents
+        if inc_fresh:
+            _reuse_source(summary, previous, "incidents")
+        elif inc_future is not None:
+            inc_df: pd.DataFrame = inc_future.result()
+            summary["incidents"] = {"rows": int(len(inc_df))}
+
+            if date_col:
+                out_path = os.path.join(outdir, "incidents_over_time.png")
+                job = pool.submit(_plot_incidents_over_time, inc_df, date_col, out_path)
+                charts.append(("incidentsOverTime", "/dashboard-assets/incidents_over_time.png", job))
+
+            # Train a small model if feasible.
+            metrics = _train_simple_incident_model(inc_df)
+            summary["model"] = asdict(metrics)
+
+        else:
+            summary["incidents"] = {"rows": 0, "note": "Incidents CSV not found"}
+            summary["model"] = asdict(ModelMetrics(enabled=False, model="LogisticRegression", target="high_risk", rows=0))
+
+        # Only link assets that were actually rendered; this also surfaces any rendering errors.
+        for asset_key, url, job in charts:
+            if job.result():
+                summary["assets"][asset_key] = url
+
+    _write_json(summary_path, summary)
 
 
 if __name__ == "__main__":
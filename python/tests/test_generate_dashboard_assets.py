@@ -0,0 +1,61 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import generate_dashboard_assets as gda  # noqa: E402
+
+
+def test_numeric_categorical_with_missing_values(tmp_path):
+    path = tmp_path / "incidents.csv"
+    rows = ["Date,Severity,Likelihood,Location"]
+    codes = ["1", "2", "3", ""]
+    for i in range(200):
+        rows.append(f"2024-01-{i % 28 + 1:02d},{i % 10},{(i * 3) % 10},{codes[i % 4]}")
+    path.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    cols = gda._needed_columns(str(path), gda.INC_COLS)
+    incidents = pd.read_csv(path, usecols=cols, **gda.READ_CSV_KWARGS)
+
+    metrics = gda._train_simple_incident_model(incidents)
+
+    assert metrics.enabled
+    assert metrics.rows == 200
+    assert metrics.accuracy is not None
+
+
+def test_damaged_parquet_cache_is_rebuilt(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "observations.csv"
+    path.write_text("Observation Type,Action Taken\nA,done\nB,\n", encoding="utf-8")
+    cols = gda._needed_columns(str(path), gda.OBS_COLS)
+
+    gda._load_table(str(path), cols)
+    (cache,) = tmp_path.glob("observations.csv.*.parquet")
+    cache.write_bytes(b"not parquet")
+
+    df = gda._load_table(str(path), cols)
+
+    assert len(df) == 2
+    assert cache.read_bytes()[:4] == b"PAR1"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_same_size_rewrite_is_not_fresh(tmp_path):
+    path = tmp_path / "incidents.csv"
+    path.write_text("Severity\n3\n", encoding="utf-8")
+    os.utime(path, ns=(1_700_000_000_000_000_000, 1_700_000_000_000_000_000))
+    previous = {
+        "sources": {"incidents": str(path)},
+        "fingerprints": {"incidents": gda._fingerprint(str(path))},
+        "assets": {},
+    }
+    assert gda._is_source_fresh(previous, "incidents", str(path), str(tmp_path))
+
+    path.write_text("Severity\n8\n", encoding="utf-8")
+    os.utime(path, ns=(1_700_000_000_500_000_000, 1_700_000_000_500_000_000))
+
+    assert not gda._is_source_fresh(previous, "incidents", str(path), str(tmp_path))